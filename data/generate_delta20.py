@@ -2,16 +2,22 @@
 generate_delta20.py
 
 Generates:
-- Delta20.npy          : 20×20 DLSFH Laplacian
-- Delta20_pinv.npy     : Moore–Penrose pseudoinverse
-- parameters.json      : Global VID numerical parameters
+- Delta20.vidb/        : bundle with the 20×20 DLSFH Laplacian (sparse),
+                         its Moore–Penrose pseudoinverse, eigendecomposition
+                         and the parameter block
+- parameters.json      : Global VID numerical parameters (human-readable copy)
+
+Requires the vid_numerics package to be importable; from the repository
+root run ``pip install -e .`` first, then ``python data/generate_delta20.py``.
 """
 
 import json
 import os
 import numpy as np
 import networkx as nx
-from scipy.linalg import pinvh
+import scipy.sparse as sp
+
+from vid_numerics import save_bundle
 
 
 # -----------------------------
@@ -53,11 +59,11 @@ def main():
 
     # Build Delta20
     Delta20 = build_delta20()
-    np.save(os.path.join(DATA_DIR, "Delta20.npy"), Delta20)
 
-    # Compute pseudoinverse
-    Delta20_pinv = pinvh(Delta20, cond=1e12)
-    np.save(os.path.join(DATA_DIR, "Delta20_pinv.npy"), Delta20_pinv)
+    # Eigendecomposition and pseudoinverse (null mode dropped below 1e-12)
+    eigvals, eigvecs = np.linalg.eigh(Delta20)
+    inv_vals = np.divide(1.0, eigvals, out=np.zeros_like(eigvals), where=eigvals > 1e-12)
+    Delta20_pinv = (eigvecs * inv_vals) @ eigvecs.T
 
     # Parameter block
     params = {
@@ -77,12 +83,22 @@ def main():
         }
     }
 
+    save_bundle(
+        os.path.join(DATA_DIR, "Delta20.vidb"),
+        {
+            "Delta": sp.csr_matrix(Delta20),
+            "Delta_pinv": Delta20_pinv,
+            "eigenvalues": eigvals,
+            "eigenvectors": eigvecs,
+        },
+        params=params,
+    )
+
     with open(os.path.join(DATA_DIR, "parameters.json"), "w") as f:
         json.dump(params, f, indent=2)
 
     print("Generated:")
-    print("  data/Delta20.npy")
-    print("  data/Delta20_pinv.npy")
+    print("  data/Delta20.vidb/")
     print("  data/parameters.json")
 
 
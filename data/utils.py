@@ -143,15 +143,16 @@ def effective_resistance_matrix(L_pinv: np.ndarray) -> np.ndarray:
     Parameters
     ----------
     L_pinv : np.ndarray
-        Moore–Penrose pseudoinverse of the graph Laplacian.
+        Moore–Penrose pseudoinverse of the graph Laplacian, or a
+        (B, n, n) stack of them.
 
     Returns
     -------
     np.ndarray
         Effective-resistance matrix R of the same shape as L_pinv.
     """
-    diag = np.diag(L_pinv).reshape(-1, 1)
-    R = diag + diag.T - 2.0 * L_pinv
+    diag = np.diagonal(L_pinv, axis1=-2, axis2=-1)
+    R = diag[..., :, None] + diag[..., None, :] - 2.0 * L_pinv
     return R
 
 
@@ -5,11 +5,18 @@ Construct the 20×20 DLSFH Laplacian using the dodecahedral graph
 and save it as L_dlsfh.npy. Also prints basic diagnostics.
 """
 
+import os
+import sys
 from typing import Tuple
 
 import numpy as np
 import networkx as nx
 
+# save_matrix / print_spectrum_report / timed come from data/utils.py
+_DATA_UTILS = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "data")
+if _DATA_UTILS not in sys.path:
+    sys.path.insert(0, _DATA_UTILS)
+
 from utils import save_matrix, print_spectrum_report, timed
 
 
@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+"""
+build_figures.py
+
+Headless, incremental build of the paper's figure set.
+
+Each figure declares the parameters and shared intermediates it depends on.
+A figure is re-rendered only if the hash of those inputs (together with the
+source of its render function) differs from the one recorded at its last
+build, or its output file is missing. Shared intermediates (the DLSFH
+Laplacian spectrum, read from the data/Delta20.vidb bundle written by
+data/generate_delta20.py) are prepared once in the parent process, and
+stale figures are rendered in parallel in a process pool using the Agg
+backend.
+
+Example:
+    python scripts/build_figures.py --jobs 4
+    python scripts/build_figures.py --set alpha=0.8 --only infinity_sector_convergence
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import inspect
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, NamedTuple, Tuple
+
+import numpy as np
+
+from vid_numerics import load_bundle
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIGURE_DIR = os.path.join(REPO_ROOT, "figures")
+BUNDLE_PATH = os.path.join(REPO_ROOT, "data", "Delta20.vidb")
+CACHE_NAME = ".build_cache.json"
+
+
+# ----------------------------------------------------------------------
+# Parameters
+# ----------------------------------------------------------------------
+
+DEFAULT_PARAMS = {
+    "N_max": 50,
+    "alpha": 0.7,
+    "alphas": [0.3, 0.5, 0.7, 0.9],
+    "three_nodes": [0, 1, 2],
+    # infty_convergence.png (values as in the manuscript)
+    "paper_N_max": 120,
+    "paper_epsilon": 0.1,
+    "paper_c": 0.94,
+    "paper_d_inf_norm": 2.71,
+    "paper_N_inf": 47,
+}
+
+
+# ----------------------------------------------------------------------
+# Shared intermediates
+# ----------------------------------------------------------------------
+
+def compute_spectrum(params: dict, bundle) -> Dict[str, np.ndarray]:
+    """
+    Eigendecomposition of the 20-vertex DLSFH (dodecahedral) Laplacian, as
+    stored in the Delta20 bundle.
+    """
+    return {"eigenvalues": bundle["eigenvalues"], "eigenvectors": bundle["eigenvectors"]}
+
+
+def compute_pinv(params: dict, bundle, spectrum: Dict[str, np.ndarray]) -> np.ndarray:
+    """
+    Moore–Penrose pseudoinverse L^+ from the cached eigendecomposition.
+    """
+    w, V = spectrum["eigenvalues"], spectrum["eigenvectors"]
+    w_inv = np.divide(1.0, w, out=np.zeros_like(w), where=w > 1e-12)
+    return (V * w_inv) @ V.T
+
+
+# name -> (function, intermediates it consumes, bundle members it reads)
+INTERMEDIATES: Dict[str, Tuple[Callable, Tuple[str, ...], Tuple[str, ...]]] = {
+    "spectrum": (compute_spectrum, (), ("eigenvalues", "eigenvectors")),
+    "pinv": (compute_pinv, ("spectrum",), ()),
+}
+
+
+def series_errors(spectrum: Dict[str, np.ndarray], alpha: float, N_max: int):
+    """
+    Errors ||S_N - S_{N_max}|| of the partial sums S_N = sum_{n<=N} K^n.
+
+    K = alpha L^+ / ||L^+||_2 shares the eigenvectors of L, so the
+    differences are diagonal in that basis and both norms follow from the
+    eigenvalues mu_i of K alone:
+        S_N - S_{N_max} = -sum_{n=N+1}^{N_max} K^n.
+    """
+    w = spectrum["eigenvalues"]
+    lam = np.divide(1.0, w, out=np.zeros_like(w), where=w > 1e-12)
+    mu = alpha * lam / np.abs(lam).max()
+
+    powers = mu[None, :] ** np.arange(N_max + 1)[:, None]
+    tails = np.cumsum(powers[::-1], axis=0)[::-1]
+    # tail starting at N+1 for N = 0..N_max
+    diff = np.vstack([tails[1:], np.zeros_like(mu)])
+    err_2 = np.abs(diff).max(axis=1)
+    err_fro = np.sqrt((diff**2).sum(axis=1))
+    return np.arange(N_max + 1), err_2, err_fro
+
+
+# ----------------------------------------------------------------------
+# Figure renderers (run in worker processes)
+# ----------------------------------------------------------------------
+
+def render_three_node(path: str, params: dict, data: dict) -> None:
+    import matplotlib.pyplot as plt
+
+    L_pinv = data["pinv"]
+    nodes = list(params["three_nodes"])
+    sub = L_pinv[np.ix_(nodes, nodes)]
+    d = np.diag(sub)
+    R = d[:, None] + d[None, :] - 2.0 * sub
+
+    fig, ax = plt.subplots(figsize=(4, 3))
+    im = ax.imshow(R)
+    ax.set_xticks(range(len(nodes)))
+    ax.set_yticks(range(len(nodes)))
+    ax.set_xticklabels(nodes)
+    ax.set_yticklabels(nodes)
+    ax.set_title("Three-node effective resistance")
+    fig.colorbar(im, ax=ax, shrink=0.8)
+    fig.tight_layout()
+    fig.savefig(path)
+    plt.close(fig)
+
+
+def render_infinity_sector(path: str, params: dict, data: dict) -> None:
+    import matplotlib.pyplot as plt
+
+    Ns, err_2, err_fro = series_errors(data["spectrum"], params["alpha"], params["N_max"])
+
+    fig, ax = plt.subplots(figsize=(6, 4))
+    ax.plot(Ns, err_2, marker="o", label=r"$||S_N - S_{N_{max}}||_2$")
+    ax.plot(Ns, err_fro, marker="s", label=r"$||S_N - S_{N_{max}}||_F$")
+    ax.set_yscale("log")
+    ax.set_xlabel("N (partial sum index)")
+    ax.set_ylabel("Error (log scale)")
+    ax.set_title(r"∞-sector convergence: partial sums of $K^n$")
+    ax.grid(True, which="both", ls=":", alpha=0.6)
+    ax.legend()
+    fig.tight_layout()
+    fig.savefig(path)
+    plt.close(fig)
+
+
+def render_alpha_comparison(path: str, params: dict, data: dict) -> None:
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(6, 4))
+    for alpha in params["alphas"]:
+        Ns, err_2, _ = series_errors(data["spectrum"], alpha, params["N_max"])
+        ax.plot(Ns, err_2, marker="o", label=fr"α = {alpha}")
+    ax.set_yscale("log")
+    ax.set_xlabel("N (partial sum index)")
+    ax.set_ylabel(r"$||S_N^{(α)} - S_{N_{max}}^{(α)}||_2$")
+    ax.set_title(r"∞-sector convergence vs $α$ (operator strength)")
+    ax.grid(True, which="both", ls=":", alpha=0.6)
+    ax.legend()
+    fig.tight_layout()
+    fig.savefig(path)
+    plt.close(fig)
+
+
+def render_infty_convergence(path: str, params: dict, data: dict) -> None:
+    import matplotlib as mpl
+    import matplotlib.pyplot as plt
+
+    # scoped, so pooled workers do not carry the paper style into later figures
+    with mpl.rc_context({
+        "axes.autolimit_mode": "round_numbers",
+        "axes.xmargin": 0.02,
+        "axes.ymargin": 0.05,
+        "legend.handlelength": 1.8,
+    }):
+        N_max = params["paper_N_max"]
+        k = np.arange(1, N_max + 1)
+        residual = params["paper_c"] * params["paper_d_inf_norm"] ** 2 * k ** (-1.0 - params["paper_epsilon"])
+        error = np.cumsum(residual[::-1])[::-1]
+
+        fig = plt.figure(figsize=(7.0, 4.8), dpi=200)
+        plt.semilogy(k, error, color="#00A1D5", linewidth=2.8,
+                     label=r"$\|\mathcal{H}_\infty - \mathcal{H}_\infty^{(N)}\|$")
+        plt.axhline(1e-10, color="gray", linestyle="--", linewidth=1.3, alpha=0.8)
+        plt.axvline(params["paper_N_inf"], color="red", linestyle=":", linewidth=2.2,
+                    label=fr"$N_\infty = {params['paper_N_inf']}$ (convergence achieved)")
+        plt.xlabel(r"Truncation order $N$ in Infinity Algebra tower", fontsize=12)
+        plt.ylabel(r"Operator-norm error", fontsize=12)
+        plt.title(r"Convergence of the $\infty$-sector (three-node VID example)", fontsize=13, pad=15)
+        plt.grid(True, which="both", ls="--", alpha=0.45)
+        plt.xlim(1, N_max)
+        plt.ylim(1e-14, 1e-1)
+        plt.legend(loc="upper right", frameon=True, fancybox=False, edgecolor="black")
+        plt.tight_layout()
+        plt.subplots_adjust(top=0.94)
+        fig.savefig(path, dpi=300, bbox_inches="tight", facecolor="white")
+        plt.close(fig)
+
+
+class FigureSpec(NamedTuple):
+    filename: str
+    render: Callable
+    params: Tuple[str, ...]
+    intermediates: Tuple[str, ...]
+
+
+FIGURES: Dict[str, FigureSpec] = {
+    "three_node_resistance": FigureSpec(
+        "three_node_resistance.png", render_three_node, ("three_nodes",), ("pinv",)),
+    "infinity_sector_convergence": FigureSpec(
+        "infinity_sector_convergence.png", render_infinity_sector, ("alpha", "N_max"), ("spectrum",)),
+    "infinity_alpha_comparison": FigureSpec(
+        "infinity_alpha_comparison.png", render_alpha_comparison, ("alphas", "N_max"), ("spectrum",)),
+    "infty_convergence": FigureSpec(
+        "infty_convergence.png", render_infty_convergence,
+        ("paper_N_max", "paper_epsilon", "paper_c", "paper_d_inf_norm", "paper_N_inf"), ()),
+}
+
+
+# ----------------------------------------------------------------------
+# Dependency hashing
+# ----------------------------------------------------------------------
+
+def _intermediate_closure(names) -> list:
+    """
+    Intermediates required by ``names``, in dependency order.
+    """
+    order = []
+
+    def visit(name):
+        if name in order:
+            return
+        for dep in INTERMEDIATES[name][1]:
+            visit(dep)
+        order.append(name)
+
+    for name in names:
+        visit(name)
+    return order
+
+
+def figure_hash(name: str, params: dict, bundle=None) -> str:
+    """
+    Hash of everything a figure depends on: its parameters, the source of
+    its renderer and of every intermediate it (transitively) consumes, and
+    the checksums of the bundle members those intermediates read.
+    """
+    spec = FIGURES[name]
+    sources = [inspect.getsource(spec.render)]
+    checksums = {}
+    for inter in _intermediate_closure(spec.intermediates):
+        fn, _, members = INTERMEDIATES[inter]
+        sources.append(inspect.getsource(fn))
+        for member in members:
+            checksums[member] = bundle.members[member]["sha256"]
+    if "spectrum" in spec.intermediates:
+        sources.append(inspect.getsource(series_errors))
+    payload = {
+        "figure": name,
+        "params": {k: params[k] for k in spec.params},
+        "sources": sources,
+        "bundle": checksums,
+    }
+    blob = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.sha256(blob).hexdigest()
+
+
+def _load_cache(out_dir: str) -> dict:
+    path = os.path.join(out_dir, CACHE_NAME)
+    if not os.path.isfile(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def _save_cache(out_dir: str, cache: dict) -> None:
+    with open(os.path.join(out_dir, CACHE_NAME), "w") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+
+
+# ----------------------------------------------------------------------
+# Build
+# ----------------------------------------------------------------------
+
+def _init_worker() -> None:
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+def _render_one(name: str, path: str, params: dict, data: dict) -> str:
+    FIGURES[name].render(path, params, data)
+    return name
+
+
+def build_figures(
+    params: dict,
+    out_dir: str = FIGURE_DIR,
+    bundle_path: str = BUNDLE_PATH,
+    only=None,
+    force: bool = False,
+    jobs: int = None,
+) -> list:
+    """
+    Render every stale figure and return the names that were rebuilt.
+
+    Parameters
+    ----------
+    params : dict
+        Full parameter set (see DEFAULT_PARAMS).
+    out_dir : str, optional
+        Output directory; also holds the build cache.
+    bundle_path : str, optional
+        Delta20 bundle providing the Laplacian eigendecomposition; only
+        opened if a requested figure needs it.
+    only : iterable of str, optional
+        Restrict the build to these figures.
+    force : bool, optional
+        Re-render even if inputs are unchanged.
+    jobs : int, optional
+        Number of worker processes (default: os.cpu_count()).
+
+    Returns
+    -------
+    list of str
+        Names of figures that were rendered.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    names = list(only) if only else list(FIGURES)
+    unknown = set(names) - set(FIGURES)
+    if unknown:
+        raise ValueError(f"Unknown figure(s): {sorted(unknown)}")
+
+    bundle = None
+    if any(FIGURES[name].intermediates for name in names):
+        bundle = load_bundle(bundle_path)
+
+    cache = _load_cache(out_dir)
+    hashes = {name: figure_hash(name, params, bundle) for name in names}
+    stale = [
+        name for name in names
+        if force
+        or cache.get(name) != hashes[name]
+        or not os.path.isfile(os.path.join(out_dir, FIGURES[name].filename))
+    ]
+    for name in names:
+        if name not in stale:
+            print(f"[figures] {name}: up to date")
+    if not stale:
+        return []
+
+    # Shared intermediates, computed once for all stale figures
+    needed = _intermediate_closure(
+        {inter for name in stale for inter in FIGURES[name].intermediates}
+    )
+    data = {}
+    for inter in needed:
+        fn, deps, _ = INTERMEDIATES[inter]
+        data[inter] = fn(params, bundle, *(data[d] for d in deps))
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as pool:
+        futures = {
+            name: pool.submit(
+                _render_one,
+                name,
+                os.path.join(out_dir, FIGURES[name].filename),
+                params,
+                {k: data[k] for k in FIGURES[name].intermediates},
+            )
+            for name in stale
+        }
+        error = None
+        for name, fut in futures.items():
+            try:
+                fut.result()
+            except Exception as exc:
+                print(f"[figures] {name}: FAILED ({exc!r})")
+                error = error or exc
+                continue
+            cache[name] = hashes[name]
+            print(f"[figures] {name}: rendered → {FIGURES[name].filename}")
+
+    # record the figures that did render even if another one failed
+    _save_cache(out_dir, cache)
+    if error is not None:
+        raise error
+    return stale
+
+
+# ----------------------------------------------------------------------
+# CLI entry point
+# ----------------------------------------------------------------------
+
+def _parse_overrides(items) -> dict:
+    overrides = {}
+    for item in items or []:
+        key, sep, value = item.partition("=")
+        if not sep or key not in DEFAULT_PARAMS:
+            raise SystemExit(f"Invalid --set {item!r}; known keys: {sorted(DEFAULT_PARAMS)}")
+        overrides[key] = json.loads(value)
+    return overrides
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the VID figure set (headless, incremental)")
+    parser.add_argument("--out", type=str, default=FIGURE_DIR, help="Output directory")
+    parser.add_argument("--bundle", type=str, default=BUNDLE_PATH, help="Delta20 bundle directory")
+    parser.add_argument("--only", nargs="+", choices=sorted(FIGURES), help="Figures to build")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if inputs are unchanged")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes")
+    parser.add_argument("--set", dest="overrides", action="append", metavar="KEY=JSON",
+                        help="Override a parameter, e.g. --set alpha=0.8")
+    args = parser.parse_args()
+
+    params = {**DEFAULT_PARAMS, **_parse_overrides(args.overrides)}
+    build_figures(params, out_dir=args.out, bundle_path=args.bundle, only=args.only, force=args.force, jobs=args.jobs)
+
+
+if __name__ == "__main__":
+    main()
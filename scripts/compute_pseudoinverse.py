@@ -10,19 +10,21 @@ If not found, it will call the constructor automatically.
 """
 
 import os
+import sys
 from typing import Tuple
 
 import numpy as np
 from scipy.linalg import pinvh
 
-from utils import (
-    load_matrix,
-    save_matrix,
-    effective_resistance_matrix,
-    print_spectrum_report,
-    timed,
-)
+# the data-directory, spectrum-report and timing helpers live in data/utils.py
+# (scripts/utils.py only holds graph builders), so it must shadow the latter
+_DATA_UTILS = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "data")
+if _DATA_UTILS not in sys.path:
+    sys.path.insert(0, _DATA_UTILS)
+
+from utils import load_matrix, save_matrix, print_spectrum_report, timed
 from build_DLSFH import build_and_save_L_dlsfh
+from vid_numerics import effective_resistance_matrix, verify_pseudoinverse
 
 
 # ---------------------------------------------------------------------------
@@ -39,16 +41,16 @@ def compute_L_pinv(L: np.ndarray, rcond: float = 1e-12) -> np.ndarray:
     L : np.ndarray
         Symmetric Laplacian matrix (n×n), rank n-1 for a connected graph.
     rcond : float, optional
-        Cutoff for small eigenvalues used by pinvh.
+        Relative cutoff for small eigenvalues (pinvh rtol).
 
     Returns
     -------
     np.ndarray
         Pseudoinverse L^+ of the same shape as L.
     """
-    # pinvh is stable for symmetric positive semidefinite matrices.
-    # We shift slightly in the null direction via rcond handling.
-    L_pinv = pinvh(L, cond=1.0 / rcond, lower=True)
+    # pinvh is stable for symmetric positive semidefinite matrices; eigenvalues
+    # below rcond times the largest one (the null direction) are discarded.
+    L_pinv = pinvh(L, rtol=rcond, lower=True)
     return L_pinv
 
 
@@ -57,7 +59,7 @@ def main_compute(save_resistance: bool = True) -> Tuple[np.ndarray, np.ndarray]:
     """
     Main driver:
     - Load or build the DLSFH Laplacian L.
-    - Compute L^+.
+    - Compute L^+ and verify it with randomized Penrose checks.
     - Optionally compute the effective-resistance matrix R.
     - Save all outputs under data/.
 
@@ -70,6 +72,11 @@ def main_compute(save_resistance: bool = True) -> Tuple[np.ndarray, np.ndarray]:
     -------
     (np.ndarray, np.ndarray)
         (L_pinv, R) where R may be None if save_resistance is False.
+
+    Raises
+    ------
+    ValueError
+        If L^+ fails the randomized Penrose / null-space verification.
     """
     # Try to load L; if missing, build it.
     try:
@@ -83,6 +90,19 @@ def main_compute(save_resistance: bool = True) -> Tuple[np.ndarray, np.ndarray]:
 
     # Compute pseudoinverse
     L_pinv = compute_L_pinv(L)
+
+    # Randomized O(k·n²) check of the Penrose and null-space conditions
+    check = verify_pseudoinverse(L, L_pinv, trials=16)
+    worst = max(v for k, v in check.items() if k not in ("passed", "failure_probability"))
+    print(
+        f"L_pinv verification: passed={check['passed']}, "
+        f"max residual≈{worst:.2e}, exact-zero miss probability≤{check['failure_probability']:.1e}"
+    )
+    if not check["passed"]:
+        raise ValueError(
+            f"L_pinv failed Moore–Penrose verification (max residual≈{worst:.2e}); not saving"
+        )
+
     path_L_pinv = save_matrix(L_pinv, "L_pinv.npy")
     print(f"L_pinv computed and saved to {path_L_pinv}")
 
@@ -0,0 +1,32 @@
+"""Graph Laplacians shared by several test modules."""
+
+import numpy as np
+import scipy.sparse as sp
+
+
+def path_laplacian(N):
+    main = np.full(N, 2.0)
+    main[[0, -1]] = 1.0
+    off = -np.ones(N - 1)
+    return sp.diags([off, main, off], [-1, 0, 1], format="csr")
+
+
+def random_graph(N, seed=0):
+    """Edges (rows, cols, weights) of an N-cycle plus about 2N random weighted chords."""
+    rng = np.random.default_rng(seed)
+    idx = np.arange(N)
+    chords = rng.integers(0, N, size=(2, 2 * N))
+    chords = chords[:, chords[0] != chords[1]]
+    rows = np.concatenate([idx, chords[0]])
+    cols = np.concatenate([(idx + 1) % N, chords[1]])
+    return rows, cols, rng.uniform(0.5, 1.5, size=len(rows))
+
+
+def edge_laplacian(N, rows, cols, w):
+    A = sp.coo_matrix((w, (rows, cols)), shape=(N, N))
+    A = (A + A.T).tocsr()
+    return (sp.diags(np.asarray(A.sum(axis=1)).ravel()) - A).tocsr()
+
+
+def random_graph_laplacian(N, seed=0):
+    return edge_laplacian(N, *random_graph(N, seed))
@@ -0,0 +1,89 @@
+import os
+
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+from vid_numerics import build_dlsfh_laplacian, compute_pseudoinverse, load_bundle, save_bundle
+from vid_numerics import bundle as bundle_module
+
+
+def test_bundle_roundtrip(tmp_path):
+    L = build_dlsfh_laplacian(20)
+    L_pinv = compute_pseudoinverse(L)
+    w = np.linalg.eigvalsh(L)
+    params = {"coherence_coupling_kappa": 0.3, "random_seed": 42}
+
+    path = save_bundle(
+        str(tmp_path / "Delta20.vidb"),
+        {"Delta": sp.csr_matrix(L), "Delta_pinv": L_pinv, "eigenvalues": w},
+        params=params,
+    )
+    bundle = load_bundle(path)
+
+    assert bundle.params == params
+    assert set(bundle) == {"Delta", "Delta_pinv", "eigenvalues"}
+    assert sp.issparse(bundle["Delta"])
+    assert np.array_equal(bundle["Delta"].toarray(), L)
+    assert np.array_equal(bundle["Delta_pinv"], L_pinv)
+    assert np.array_equal(bundle["eigenvalues"], w)
+
+
+def test_bundle_loads_members_lazily(tmp_path):
+    path = save_bundle(str(tmp_path / "b"), {"a": np.arange(5), "b": np.eye(3)})
+    os.remove(os.path.join(path, load_bundle(path).members["b"]["file"]))
+
+    bundle = load_bundle(path)
+    assert np.array_equal(bundle["a"], np.arange(5))
+    with pytest.raises(FileNotFoundError):
+        bundle["b"]
+
+
+def test_bundle_membership_does_not_load(tmp_path):
+    path = save_bundle(str(tmp_path / "b"), {"a": np.arange(5), "big": np.eye(50)})
+    bundle = load_bundle(path)
+    os.remove(os.path.join(path, bundle.members["big"]["file"]))
+
+    assert "big" in bundle
+    assert "missing" not in bundle
+    assert bundle._cache == {}
+
+
+def test_bundle_detects_corruption(tmp_path):
+    path = save_bundle(str(tmp_path / "b"), {"a": np.arange(100.0)})
+    member = os.path.join(path, load_bundle(path).members["a"]["file"])
+    with open(member, "r+b") as f:
+        f.seek(-1, os.SEEK_END)
+        last = f.read(1)
+        f.seek(-1, os.SEEK_END)
+        f.write(bytes([last[0] ^ 0xFF]))
+
+    with pytest.raises(ValueError, match="Checksum"):
+        load_bundle(path)["a"]
+
+
+def test_bundle_rewrite_removes_stale_members(tmp_path):
+    path = str(tmp_path / "b")
+    save_bundle(path, {"a": np.arange(3), "old": np.eye(2)})
+    save_bundle(path, {"a": np.arange(4)})
+
+    assert sorted(os.listdir(path)) == [load_bundle(path).members["a"]["file"], "manifest.json"]
+    bundle = load_bundle(path)
+    assert set(bundle) == {"a"}
+    assert np.array_equal(bundle["a"], np.arange(4))
+
+
+def test_bundle_rewrite_keeps_old_manifest_readable(tmp_path, monkeypatch):
+    path = str(tmp_path / "b")
+    save_bundle(path, {"a": np.arange(3.0)})
+
+    def crash(*args, **kwargs):
+        raise OSError("disk full")
+
+    # a rewrite that dies after writing members but before the manifest swap
+    monkeypatch.setattr(bundle_module.json, "dump", crash)
+    with pytest.raises(OSError):
+        save_bundle(path, {"a": np.arange(4.0)})
+    monkeypatch.undo()
+
+    assert np.array_equal(load_bundle(path)["a"], np.arange(3.0))
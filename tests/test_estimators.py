@@ -0,0 +1,47 @@
+import numpy as np
+
+from vid_numerics import (
+    build_dlsfh_laplacian,
+    compute_pseudoinverse,
+    effective_resistance_matrix,
+    estimate_pinv_diagonal,
+    estimate_pinv_trace,
+    kirchhoff_index,
+    total_resistance,
+)
+
+from _graphs import random_graph_laplacian
+
+
+def test_exact_fallback_for_small_graphs():
+    L = build_dlsfh_laplacian(20)
+    L_pinv = compute_pseudoinverse(L)
+    R = effective_resistance_matrix(L_pinv)
+
+    diag = estimate_pinv_diagonal(L)
+    assert diag.n_solves == 0
+    assert np.allclose(diag.value, np.diag(L_pinv))
+    assert np.isclose(estimate_pinv_trace(L).value, np.trace(L_pinv))
+    assert np.isclose(kirchhoff_index(L).value, R.sum() / 2.0)
+    assert np.allclose(total_resistance(L).value, R.sum(axis=1))
+
+
+def test_stochastic_estimates_meet_target():
+    L = random_graph_laplacian(600, seed=1)
+    d = np.diag(compute_pseudoinverse(L.toarray(), hermitian=True))
+
+    trace = estimate_pinv_trace(L, rtol=0.01, exact_below=0, seed=2)
+    assert 0 < trace.n_solves < 600
+    assert abs(trace.value - d.sum()) <= 5 * trace.stderr + 1e-3 * d.sum()
+    assert trace.stderr <= 0.01 * abs(trace.value)
+
+    diag = estimate_pinv_diagonal(L, rtol=0.1, exact_below=0, seed=3)
+    assert np.all(diag.stderr <= 0.1 * np.abs(diag.value))
+    assert np.median(np.abs(diag.value - d) / d) < 0.1
+
+
+def test_estimates_are_reproducible_with_seed():
+    L = random_graph_laplacian(300, seed=4)
+    a = estimate_pinv_trace(L, exact_below=0, seed=7)
+    b = estimate_pinv_trace(L, exact_below=0, seed=7)
+    assert a == b
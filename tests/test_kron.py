@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+import scipy.sparse as sp
+from scipy.sparse.linalg import splu
+
+from vid_numerics import (
+    build_dlsfh_laplacian,
+    compute_pseudoinverse,
+    effective_resistance_matrix,
+    kron_reduce,
+    kron_reduce_many,
+    kron_resistance_matrix,
+)
+from vid_numerics import kron
+
+
+def _grid_laplacian(m):
+    path = sp.diags([-np.ones(m - 1), -np.ones(m - 1)], [-1, 1])
+    A = sp.kron(sp.identity(m), path) + sp.kron(path, sp.identity(m))
+    A = -A.tocsr()
+    return (sp.diags(np.asarray(A.sum(axis=1)).ravel()) - A).tocsr()
+
+
+def test_three_node_resistance_matches_full_pseudoinverse():
+    L = build_dlsfh_laplacian(20)
+    nodes = [0, 1, 2]
+    R_full = effective_resistance_matrix(compute_pseudoinverse(L))
+
+    L_red = kron_reduce(L, nodes)
+    assert L_red.shape == (3, 3)
+    assert np.allclose(L_red, L_red.T)
+    assert np.allclose(L_red.sum(axis=1), 0.0)
+    assert np.allclose(kron_resistance_matrix(L, nodes), R_full[np.ix_(nodes, nodes)])
+
+
+def test_kron_reduce_many_reuses_union():
+    L = _grid_laplacian(15)
+    sets = [[0, 7, 224], [112, 0], [5, 60, 100, 200]]
+    R_full = effective_resistance_matrix(compute_pseudoinverse(L.toarray(), hermitian=True))
+
+    for nodes, L_red in zip(sets, kron_reduce_many(L, sets)):
+        assert np.allclose(L_red, kron_reduce(L, nodes))
+        R = effective_resistance_matrix(compute_pseudoinverse(L_red, hermitian=True))
+        assert np.allclose(R, R_full[np.ix_(nodes, nodes)])
+
+
+def test_kron_reduce_many_factors_once(monkeypatch):
+    L = _grid_laplacian(12)
+    calls = []
+
+    def counting_splu(A):
+        calls.append(A.shape)
+        return splu(A)
+
+    monkeypatch.setattr(kron, "splu", counting_splu)
+    rng = np.random.default_rng(0)
+    sets = [rng.choice(144, size=k, replace=False) for k in (1, 2, 5, 9, 9, 30)]
+    reduced = kron_reduce_many(L, sets)
+    assert len(calls) == 1
+
+    monkeypatch.undo()
+    for nodes, L_red in zip(sets, reduced):
+        assert np.allclose(L_red, kron_reduce(L, nodes), atol=1e-10)
+
+
+def test_kron_reduce_rejects_bad_nodes():
+    L = build_dlsfh_laplacian(10)
+    with pytest.raises(ValueError):
+        kron_reduce(L, [1, 1])
+    with pytest.raises(ValueError):
+        kron_reduce(L, [10])
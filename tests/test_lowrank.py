@@ -0,0 +1,55 @@
+import numpy as np
+
+from vid_numerics import (
+    compute_pseudoinverse,
+    effective_resistance,
+    effective_resistance_matrix,
+    low_rank_pseudoinverse,
+)
+from vid_numerics.laplacian import build_dlsfh_laplacian
+
+from _graphs import path_laplacian
+
+
+def test_low_rank_error_bound_holds():
+    L = path_laplacian(200)
+    L_pinv = compute_pseudoinverse(L.toarray(), hermitian=True)
+
+    approx = low_rank_pseudoinverse(L, rank=10)
+    assert approx.U.shape == (200, 10)
+    err = np.linalg.norm(L_pinv - approx.to_dense(), ord=2)
+    assert err <= approx.error_bound * (1 + 1e-8)
+
+
+def test_low_rank_tol_mode_meets_target():
+    L = path_laplacian(150)
+    L_pinv = compute_pseudoinverse(L.toarray(), hermitian=True)
+
+    approx = low_rank_pseudoinverse(L, tol=1.0)
+    assert approx.error_bound <= 1.0 + 1e-6
+    assert np.linalg.norm(L_pinv - approx.to_dense(), ord=2) <= approx.error_bound * (1 + 1e-8)
+
+
+def test_full_rank_recovers_dense_resistance():
+    L = build_dlsfh_laplacian(20)
+    approx = low_rank_pseudoinverse(L, rank=19)
+    R = effective_resistance_matrix(compute_pseudoinverse(L))
+
+    assert approx.error_bound < 1e-8
+    assert np.allclose(effective_resistance_matrix(approx), R)
+    i, j = np.array([0, 3, 7]), np.array([5, 3, 12])
+    assert np.allclose(effective_resistance(approx, i, j), R[i, j])
+
+
+def test_bound_with_degenerate_eigenvalues():
+    # the 20-cycle Laplacian has doubly degenerate eigenvalues
+    L = build_dlsfh_laplacian(20)
+    L_pinv = compute_pseudoinverse(L)
+
+    approx = low_rank_pseudoinverse(L, tol=0.5)
+    assert approx.error_bound <= 0.5
+    assert np.linalg.norm(L_pinv - approx.to_dense(), ord=2) <= approx.error_bound * (1 + 1e-8)
+
+    # a rank that splits a degenerate cluster still gets a valid bound
+    split = low_rank_pseudoinverse(L, rank=1)
+    assert np.linalg.norm(L_pinv - split.to_dense(), ord=2) <= split.error_bound * (1 + 1e-8)
@@ -0,0 +1,113 @@
+import importlib
+import os
+import sys
+
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+from vid_numerics import compute_pseudoinverse, effective_resistance_matrix, verify_pseudoinverse
+from vid_numerics.laplacian import build_dlsfh_laplacian
+
+
+def _weighted_cycle_stack(B, N, seed=0):
+    rng = np.random.default_rng(seed)
+    w = rng.uniform(0.5, 2.0, size=(B, N))
+    L = np.zeros((B, N, N))
+    idx = np.arange(N)
+    nxt = (idx + 1) % N
+    L[:, idx, nxt] = -w
+    L[:, nxt, idx] = -w
+    L[:, idx, idx] = -L.sum(axis=2)
+    return L
+
+
+def test_pseudoinverse_penrose_conditions():
+    L = build_dlsfh_laplacian(20)
+    L_pinv = compute_pseudoinverse(L)
+
+    assert np.allclose(L @ L_pinv @ L, L)
+    assert np.allclose(L_pinv @ L @ L_pinv, L_pinv)
+    assert np.allclose(L_pinv, L_pinv.T)
+    assert np.allclose(L_pinv @ np.ones(20), 0.0)
+
+
+def test_batched_pseudoinverse_matches_loop():
+    L = _weighted_cycle_stack(7, 12)
+    expected = np.stack([compute_pseudoinverse(Lb) for Lb in L])
+
+    assert np.allclose(compute_pseudoinverse(L), expected)
+    assert np.allclose(compute_pseudoinverse(L, hermitian=True), expected)
+    # a tiny budget forces one matrix per chunk
+    assert np.allclose(compute_pseudoinverse(L, hermitian=True, max_bytes=1), expected)
+
+
+def test_batched_effective_resistance():
+    L = _weighted_cycle_stack(5, 10, seed=1)
+    R = effective_resistance_matrix(compute_pseudoinverse(L, hermitian=True))
+
+    assert R.shape == L.shape
+    for b in range(L.shape[0]):
+        assert np.allclose(R[b], effective_resistance_matrix(compute_pseudoinverse(L[b])))
+    assert np.allclose(np.diagonal(R, axis1=1, axis2=2), 0.0)
+
+
+def _cycle_pinv(N):
+    # L^+ of the cycle is circulant; build it from its first column via FFT
+    lam = 2.0 - 2.0 * np.cos(2.0 * np.pi * np.arange(N) / N)
+    inv = np.divide(1.0, lam, out=np.zeros(N), where=lam > 1e-12)
+    col = np.fft.ifft(inv).real
+    idx = np.arange(N)
+    return col[(idx[:, None] - idx[None, :]) % N]
+
+
+def test_verify_pseudoinverse_large_sparse():
+    N = 2000
+    L = sp.diags([-1.0, -1.0, 2.0, -1.0, -1.0], [-(N - 1), -1, 0, 1, N - 1], shape=(N, N), format="csr")
+    L_pinv = _cycle_pinv(N)
+
+    check = verify_pseudoinverse(L, L_pinv, trials=8, seed=0)
+    assert check["passed"], check
+    assert check["failure_probability"] == 2.0**-8
+
+    bad = L_pinv.copy()
+    bad[3, 7] += 1e-3
+    check = verify_pseudoinverse(L, bad, trials=8, seed=0)
+    assert not check["passed"]
+    assert check["penrose3"] > 1e-8
+
+
+def test_verify_pseudoinverse_detects_null_space_violation():
+    L = build_dlsfh_laplacian(20)
+    shifted = compute_pseudoinverse(L) + 0.1 / 20
+
+    check = verify_pseudoinverse(L, shifted, seed=1)
+    assert not check["passed"]
+    assert check["null"] > 1e-3
+
+
+def _import_script(monkeypatch, name):
+    scripts = os.path.join(os.path.dirname(__file__), os.pardir, "scripts")
+    monkeypatch.syspath_prepend(scripts)
+    for module in (name, "utils", "build_DLSFH"):
+        monkeypatch.delitem(sys.modules, module, raising=False)
+    return importlib.import_module(name)
+
+
+def test_main_compute_refuses_to_save_bad_pinv(monkeypatch):
+    pytest.importorskip("networkx")
+    script = _import_script(monkeypatch, "compute_pseudoinverse")
+    L = build_dlsfh_laplacian(20)
+    saved = []
+    monkeypatch.setattr(script, "load_matrix", lambda filename: L)
+    monkeypatch.setattr(script, "save_matrix", lambda matrix, filename: saved.append(filename))
+
+    L_pinv, R = script.main_compute(save_resistance=True)
+    assert np.allclose(L_pinv, compute_pseudoinverse(L))
+    assert saved == ["L_pinv.npy", "R_eff.npy"]
+
+    saved.clear()
+    monkeypatch.setattr(script, "compute_L_pinv", lambda L: compute_pseudoinverse(L) + 0.1 / 20)
+    with pytest.raises(ValueError, match="not saving"):
+        script.main_compute(save_resistance=True)
+    assert saved == []
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from vid_numerics import (
+    LaplacianSequenceSolver,
+    compute_pseudoinverse,
+    effective_resistance_matrix,
+    grounded_solver,
+)
+
+from _graphs import edge_laplacian, random_graph, random_graph_laplacian
+
+
+def test_grounded_solver_matches_pseudoinverse():
+    N = 60
+    L = random_graph_laplacian(N)
+    b = np.random.default_rng(1).standard_normal((N, 3))
+
+    expected = compute_pseudoinverse(L.toarray(), hermitian=True) @ b
+    assert np.allclose(grounded_solver(L)(b), expected)
+
+
+def test_sequence_solver_warm_starts_smooth_ramp():
+    N = 300
+    rows, cols, w0 = random_graph(N, seed=2)
+    b = np.random.default_rng(3).standard_normal(N)
+    solver = LaplacianSequenceSolver(rtol=1e-10)
+
+    iterations = []
+    for kappa in np.linspace(0.0, 0.3, 20):
+        L = edge_laplacian(N, rows, cols, w0 * (1.0 + kappa * np.cos(np.arange(len(w0)))))
+        solver.update(L)
+        x = solver.solve(b, key="b")
+        iterations.append(solver.last_iterations)
+
+        L_pinv = compute_pseudoinverse(L.toarray(), hermitian=True)
+        assert np.allclose(x, L_pinv @ b, atol=1e-8)
+        R = effective_resistance_matrix(L_pinv)
+        assert np.isclose(solver.effective_resistance(0, N // 2), R[0, N // 2])
+
+    assert solver.n_factorizations == 1
+    assert max(iterations[1:]) <= 10
+
+
+def test_sequence_solver_refactors_on_abrupt_change():
+    N = 200
+    rows, cols, w0 = random_graph(N, seed=4)
+    b = np.random.default_rng(5).standard_normal(N)
+    solver = LaplacianSequenceSolver(refactor_ratio=2.0, min_iter=2, recycle=0)
+
+    solver.update(edge_laplacian(N, rows, cols, w0))
+    solver.solve(b)
+    w_new = np.random.default_rng(6).uniform(0.01, 100.0, size=len(w0))
+    L_new = edge_laplacian(N, rows, cols, w_new)
+    solver.update(L_new)
+    x = solver.solve(b)
+
+    assert solver.n_factorizations == 2
+    assert np.allclose(x, compute_pseudoinverse(L_new.toarray(), hermitian=True) @ b, atol=1e-8)
+
+
+def test_sequence_solver_bounds_keyed_cache():
+    N = 100
+    L = random_graph_laplacian(N, seed=7)
+    solver = LaplacianSequenceSolver(cache_size=4)
+    solver.update(L)
+
+    for j in range(1, 20):
+        solver.effective_resistance(0, j)
+    assert len(solver._solutions) == 4
+    assert ("resistance", 0, 19) in solver._solutions
+
+    solver.forget(("resistance", 0, 19))
+    assert ("resistance", 0, 19) not in solver._solutions
+    solver.forget()
+    assert not solver._solutions
+
+
+def test_sequence_solver_warns_when_not_converged():
+    N = 200
+    L = random_graph_laplacian(N, seed=8)
+    solver = LaplacianSequenceSolver(rtol=1e-30, max_iter=2)
+    solver.update(L)
+
+    with pytest.warns(RuntimeWarning, match="did not converge"):
+        solver.solve(np.random.default_rng(9).standard_normal(N))
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from vid_numerics import (
+    build_dlsfh_laplacian,
+    compute_pseudoinverse,
+    filtered_pseudoinverses,
+    regularized_propagators,
+)
+
+from _graphs import path_laplacian
+
+
+def test_dense_regularized_propagators():
+    L = build_dlsfh_laplacian(20)
+    mus = [0.0, 0.01, 0.5, 3.0]
+    G = regularized_propagators(L, mus)
+
+    assert G.shape == (4, 20, 20)
+    assert np.allclose(G[0], compute_pseudoinverse(L))
+    for k, mu in enumerate(mus[1:], start=1):
+        assert np.allclose(G[k], np.linalg.inv(L + mu * np.eye(20)))
+
+
+def test_sparse_multishift_matches_dense():
+    N = 200
+    L = path_laplacian(N)
+    b = np.random.default_rng(0).standard_normal((N, 2))
+    mus = np.array([1.0, 0.0, 1e-3, 10.0])
+
+    sparse = regularized_propagators(L, mus, b, rtol=1e-12, max_iter=2000)
+    dense = regularized_propagators(L.toarray(), mus, b)
+
+    assert sparse.shape == (4, N, 2)
+    assert np.allclose(sparse, dense, rtol=1e-7, atol=1e-7)
+    single = regularized_propagators(L, mus, b[:, 0], rtol=1e-12, max_iter=2000)
+    assert np.allclose(single, dense[..., 0], rtol=1e-7, atol=1e-7)
+
+
+def test_filtered_pseudoinverses_match_tol():
+    L = path_laplacian(40).toarray()
+    cutoffs = [0.5, 1e-12, 0.01, 1.9, 10.0]
+    F = filtered_pseudoinverses(L, cutoffs)
+
+    for k, c in enumerate(cutoffs):
+        assert np.allclose(F[k], compute_pseudoinverse(L, tol=c), atol=1e-9)
+    assert np.allclose(F[-1], 0.0)
+
+    b = np.random.default_rng(1).standard_normal(40)
+    assert np.allclose(filtered_pseudoinverses(L, cutoffs, b), F @ b)
+
+
+def test_multishift_warns_when_unconverged():
+    L = path_laplacian(200)
+    b = np.random.default_rng(2).standard_normal(200)
+    with pytest.warns(RuntimeWarning, match="did not converge"):
+        regularized_propagators(L, [0.0, 1e-3], b, max_iter=3)
+
+
+def test_empty_parameter_arrays_rejected():
+    L = path_laplacian(10)
+    b = np.ones(10)
+    with pytest.raises(ValueError):
+        regularized_propagators(L, [], b)
+    with pytest.raises(ValueError):
+        filtered_pseudoinverses(L.toarray(), [])
@@ -2,10 +2,42 @@
 vid_numerics: core numerical utilities for Valamontes Interaction Diagrams (VID).
 """
 
+from .bundle import load_bundle, save_bundle
+from .estimators import (
+    StochasticEstimate,
+    estimate_pinv_diagonal,
+    estimate_pinv_trace,
+    kirchhoff_index,
+    total_resistance,
+)
+from .kron import kron_reduce, kron_reduce_many, kron_resistance_matrix
 from .laplacian import build_dlsfh_laplacian
-from .pseudoinverse import compute_pseudoinverse
+from .lowrank import LowRankPseudoinverse, low_rank_pseudoinverse
+from .pseudoinverse import compute_pseudoinverse, verify_pseudoinverse
+from .resistance import effective_resistance, effective_resistance_matrix
+from .solvers import LaplacianSequenceSolver, grounded_solver
+from .spectral import filtered_pseudoinverses, regularized_propagators
 
 __all__ = [
     "build_dlsfh_laplacian",
     "compute_pseudoinverse",
+    "effective_resistance",
+    "effective_resistance_matrix",
+    "estimate_pinv_diagonal",
+    "estimate_pinv_trace",
+    "filtered_pseudoinverses",
+    "grounded_solver",
+    "kirchhoff_index",
+    "kron_reduce",
+    "kron_reduce_many",
+    "kron_resistance_matrix",
+    "LaplacianSequenceSolver",
+    "load_bundle",
+    "low_rank_pseudoinverse",
+    "LowRankPseudoinverse",
+    "regularized_propagators",
+    "save_bundle",
+    "StochasticEstimate",
+    "total_resistance",
+    "verify_pseudoinverse",
 ]
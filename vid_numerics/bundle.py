@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import re
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, Mapping, Optional
+
+import numpy as np
+import scipy.sparse as sp
+
+BUNDLE_FORMAT = "vid-bundle"
+BUNDLE_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+
+_MEMBER_NAME = re.compile(r"^[A-Za-z0-9_.\-]+$")
+
+
+def _serialize(value) -> tuple:
+    """
+    Serialize one member to raw bytes; returns (kind, bytes, shape, dtype).
+    """
+    buf = io.BytesIO()
+    if sp.issparse(value):
+        value = sp.csr_matrix(value)
+        sp.save_npz(buf, value, compressed=False)
+        return "csr", buf.getvalue(), list(value.shape), str(value.dtype)
+
+    value = np.asarray(value)
+    np.save(buf, value, allow_pickle=False)
+    return "dense", buf.getvalue(), list(value.shape), str(value.dtype)
+
+
+def _deserialize(kind: str, raw: bytes):
+    buf = io.BytesIO(raw)
+    if kind == "csr":
+        return sp.load_npz(buf).tocsr()
+    return np.load(buf, allow_pickle=False)
+
+
+def _encode_member(value, level: int) -> tuple:
+    kind, raw, shape, dtype = _serialize(value)
+    payload = zlib.compress(raw, level)
+    return kind, payload, shape, dtype, len(raw)
+
+
+def save_bundle(
+    path: str,
+    members: Mapping[str, Any],
+    params: Optional[Dict[str, Any]] = None,
+    level: int = 6,
+    max_workers: Optional[int] = None,
+) -> str:
+    """
+    Write arrays and a parameter block as a self-describing bundle directory.
+
+    Each member is stored as its own zlib-compressed file so it can be read
+    independently; compression runs in a thread pool (zlib releases the GIL).
+    ``manifest.json`` records the kind, shape, dtype, sizes and SHA-256 of
+    every member together with ``params``. Member files are named after
+    their content hash, so a rewrite never touches the files the previous
+    manifest points to; the manifest is written last and swapped in
+    atomically, after which member files not listed in it are removed.
+
+    Parameters
+    ----------
+    path : str
+        Bundle directory, created if needed.
+    members : Mapping[str, array_like or scipy.sparse matrix]
+        Named members. Sparse matrices are stored in CSR form.
+    params : dict, optional
+        JSON-serialisable parameter block.
+    level : int, optional
+        zlib compression level (0–9).
+    max_workers : int, optional
+        Number of compression threads (default: ThreadPoolExecutor default).
+
+    Returns
+    -------
+    str
+        Path to the bundle directory.
+    """
+    for name in members:
+        if not _MEMBER_NAME.match(name) or name == MANIFEST_NAME:
+            raise ValueError(f"Invalid bundle member name: {name!r}")
+
+    os.makedirs(path, exist_ok=True)
+    names = list(members)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        encoded = list(pool.map(lambda n: _encode_member(members[n], level), names))
+
+    entries = {}
+    for name, (kind, payload, shape, dtype, raw_size) in zip(names, encoded):
+        digest = hashlib.sha256(payload).hexdigest()
+        # content-addressed, so files listed in the current manifest are never overwritten
+        filename = f"{name}.{digest[:16]}.{'npz' if kind == 'csr' else 'npy'}.z"
+        member_path = os.path.join(path, filename)
+        if not os.path.isfile(member_path):
+            with open(member_path + ".tmp", "wb") as f:
+                f.write(payload)
+            os.replace(member_path + ".tmp", member_path)
+        entries[name] = {
+            "file": filename,
+            "kind": kind,
+            "shape": shape,
+            "dtype": dtype,
+            "size": len(payload),
+            "raw_size": raw_size,
+            "sha256": digest,
+        }
+
+    manifest = {
+        "format": BUNDLE_FORMAT,
+        "version": BUNDLE_VERSION,
+        "params": params or {},
+        "members": entries,
+    }
+    manifest_path = os.path.join(path, MANIFEST_NAME)
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, manifest_path)
+
+    # drop member files left over from a previous write of this bundle
+    current = {entry["file"] for entry in entries.values()}
+    for filename in os.listdir(path):
+        if filename.endswith((".z", ".z.tmp")) and filename not in current:
+            os.remove(os.path.join(path, filename))
+    return path
+
+
+class Bundle(Mapping):
+    """
+    Read-only, lazily loaded view of a bundle written by :func:`save_bundle`.
+
+    Only the manifest is read on open; each member is read, checksum-verified
+    and decompressed on first access, then cached.
+    """
+
+    def __init__(self, path: str):
+        manifest_path = os.path.join(path, MANIFEST_NAME)
+        if not os.path.isfile(manifest_path):
+            raise FileNotFoundError(f"Bundle manifest not found: {manifest_path}")
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        if manifest.get("format") != BUNDLE_FORMAT:
+            raise ValueError(f"Not a {BUNDLE_FORMAT} directory: {path}")
+        if manifest.get("version", 0) > BUNDLE_VERSION:
+            raise ValueError(f"Unsupported bundle version {manifest['version']}")
+
+        self.path = path
+        self.params: Dict[str, Any] = manifest["params"]
+        self.members: Dict[str, Dict[str, Any]] = manifest["members"]
+        self._cache: Dict[str, Any] = {}
+
+    def __getitem__(self, name: str):
+        if name not in self._cache:
+            if name not in self.members:
+                raise KeyError(name)
+            self._cache[name] = self._read(name)
+        return self._cache[name]
+
+    def __contains__(self, name) -> bool:
+        return name in self.members
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.members)
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def _read(self, name: str):
+        entry = self.members[name]
+        with open(os.path.join(self.path, entry["file"]), "rb") as f:
+            payload = f.read()
+        if hashlib.sha256(payload).hexdigest() != entry["sha256"]:
+            raise ValueError(f"Checksum mismatch for bundle member {name!r}")
+        return _deserialize(entry["kind"], zlib.decompress(payload))
+
+
+def load_bundle(path: str) -> Bundle:
+    """
+    Open a bundle directory for lazy, per-member loading.
+
+    Parameters
+    ----------
+    path : str
+        Bundle directory written by :func:`save_bundle`.
+
+    Returns
+    -------
+    Bundle
+        Mapping from member name to array (or CSR matrix); ``.params``
+        holds the parameter block.
+    """
+    return Bundle(path)
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+from typing import Callable, NamedTuple, Optional, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+
+from .pseudoinverse import compute_pseudoinverse
+from .solvers import grounded_solver
+
+
+class StochasticEstimate(NamedTuple):
+    """
+    Result of a randomized estimator.
+
+    Attributes
+    ----------
+    value : float or np.ndarray
+        Estimated quantity.
+    stderr : float or np.ndarray
+        Standard error of the estimate (zero for the exact fallback).
+    n_solves : int
+        Number of Laplacian solves used (zero for the exact fallback).
+    """
+
+    value: object
+    stderr: object
+    n_solves: int
+
+
+def _exact_diagonal(L) -> np.ndarray:
+    L = L.toarray() if sp.issparse(L) else np.asarray(L, dtype=float)
+    return np.diag(compute_pseudoinverse(L, hermitian=True)).copy()
+
+
+def _diag_samples(
+    L,
+    rtol: float,
+    sketch: int,
+    batch: int,
+    max_probes: int,
+    seed,
+    solve: Optional[Callable[[np.ndarray], np.ndarray]],
+    reduce: Callable[[np.ndarray], np.ndarray],
+) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Deflated (Hutch++-style) Hutchinson estimate of ``reduce(diag(L^+))``.
+
+    A rank-``sketch`` range finder Q of L^+ is built first and its
+    contribution diag(Q Q^T L^+) is computed exactly; the remainder
+    diag((I - Q Q^T) L^+) is estimated from Rademacher probes z via
+    z ⊙ (I - Q Q^T) L^+ z, in batches, until the standard error of
+    ``reduce`` of the estimate drops below ``rtol`` times its magnitude.
+    """
+    n = L.shape[0]
+    rng = np.random.default_rng(seed)
+    if solve is None:
+        solve = grounded_solver(L)
+
+    n_solves = 0
+    low = np.zeros(n)
+    Q = np.zeros((n, 0))
+    B = np.zeros((n, 0))
+    if sketch > 0:
+        S = rng.choice([-1.0, 1.0], size=(n, sketch))
+        Q, _ = np.linalg.qr(solve(S))
+        B = solve(Q)
+        n_solves += 2 * sketch
+        low = np.sum(Q * B, axis=1)
+
+    samples = []
+    while True:
+        Z = rng.choice([-1.0, 1.0], size=(n, batch))
+        X = solve(Z)
+        n_solves += batch
+        X -= Q @ (B.T @ Z)
+        samples.append(reduce(Z * X))
+
+        stacked = np.concatenate(samples, axis=-1)
+        k = stacked.shape[-1]
+        mean = stacked.mean(axis=-1)
+        stderr = stacked.std(axis=-1, ddof=1) / np.sqrt(k)
+        value = reduce(low[:, None])[..., 0] + mean
+        if np.all(stderr <= rtol * np.abs(value)) or k >= max_probes:
+            return value, stderr, n_solves
+
+
+def estimate_pinv_diagonal(
+    L,
+    rtol: float = 0.05,
+    sketch: int = 16,
+    batch: int = 16,
+    max_probes: int = 1024,
+    exact_below: int = 500,
+    seed=None,
+    solve: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+) -> StochasticEstimate:
+    """
+    Estimate diag(L^+) from Laplacian solves with random probe vectors.
+
+    Probes are added until every entry's standard error is below ``rtol``
+    times its value (or ``max_probes`` is reached). Graphs with fewer than
+    ``exact_below`` nodes use the dense pseudoinverse instead.
+
+    Parameters
+    ----------
+    L : np.ndarray or scipy.sparse matrix
+        Symmetric N×N Laplacian of a connected graph.
+    rtol : float, optional
+        Target relative standard error per entry.
+    sketch : int, optional
+        Rank of the deflation sketch (costs 2·sketch solves).
+    batch : int, optional
+        Probes added per round.
+    max_probes : int, optional
+        Cap on the number of Hutchinson probes.
+    exact_below : int, optional
+        Use the exact dense computation when N < exact_below.
+    seed : int or np.random.Generator, optional
+        Seed for the probe vectors.
+    solve : callable, optional
+        Function applying L^+ to an N×m block; defaults to
+        :func:`grounded_solver`.
+
+    Returns
+    -------
+    StochasticEstimate
+        Estimated diagonal, per-entry standard errors and solve count.
+    """
+    n = L.shape[0]
+    if n < exact_below:
+        return StochasticEstimate(_exact_diagonal(L), np.zeros(n), 0)
+    value, stderr, n_solves = _diag_samples(
+        L, rtol, sketch, batch, max_probes, seed, solve, reduce=lambda D: D
+    )
+    return StochasticEstimate(value, stderr, n_solves)
+
+
+def estimate_pinv_trace(
+    L,
+    rtol: float = 0.01,
+    sketch: int = 16,
+    batch: int = 16,
+    max_probes: int = 1024,
+    exact_below: int = 500,
+    seed=None,
+    solve: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+) -> StochasticEstimate:
+    """
+    Estimate tr(L^+) with a Hutch++-style deflated Hutchinson estimator.
+
+    Parameters are as for :func:`estimate_pinv_diagonal`, with ``rtol``
+    the target relative standard error of the trace.
+
+    Returns
+    -------
+    StochasticEstimate
+        Estimated trace, its standard error and solve count.
+    """
+    n = L.shape[0]
+    if n < exact_below:
+        return StochasticEstimate(float(_exact_diagonal(L).sum()), 0.0, 0)
+    value, stderr, n_solves = _diag_samples(
+        L, rtol, sketch, batch, max_probes, seed, solve, reduce=lambda D: D.sum(axis=0)
+    )
+    return StochasticEstimate(float(value), float(stderr), n_solves)
+
+
+def kirchhoff_index(L, **kwargs) -> StochasticEstimate:
+    """
+    Kirchhoff index Kf = N · tr(L^+) (sum of all pairwise resistances).
+
+    Keyword arguments are passed to :func:`estimate_pinv_trace`.
+    """
+    n = L.shape[0]
+    est = estimate_pinv_trace(L, **kwargs)
+    return StochasticEstimate(n * est.value, n * est.stderr, est.n_solves)
+
+
+def total_resistance(L, **kwargs) -> StochasticEstimate:
+    """
+    Total effective resistance from each node, R_i = sum_j R_ij.
+
+    Since the rows of L^+ sum to zero, R_i = N · L^+_ii + tr(L^+), so this
+    follows from the diagonal estimate. Keyword arguments are passed to
+    :func:`estimate_pinv_diagonal`; the reported standard error covers the
+    diagonal term only.
+    """
+    n = L.shape[0]
+    est = estimate_pinv_diagonal(L, **kwargs)
+    value = n * est.value + est.value.sum()
+    return StochasticEstimate(value, n * est.stderr, est.n_solves)
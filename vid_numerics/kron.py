@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from typing import Iterable, List, Sequence
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import splu
+
+from .pseudoinverse import compute_pseudoinverse
+from .resistance import effective_resistance_matrix
+
+
+def _split(n: int, nodes: Sequence[int]):
+    nodes = np.asarray(nodes, dtype=int)
+    if nodes.ndim != 1 or len(nodes) == 0:
+        raise ValueError("nodes must be a non-empty 1-D sequence of indices")
+    if len(np.unique(nodes)) != len(nodes):
+        raise ValueError("nodes must not contain duplicates")
+    if nodes.min() < 0 or nodes.max() >= n:
+        raise ValueError(f"node indices must lie in [0, {n})")
+    interior = np.setdiff1d(np.arange(n), nodes)
+    return nodes, interior
+
+
+def kron_reduce(L, nodes: Sequence[int]) -> np.ndarray:
+    """
+    Kron reduction of a Laplacian onto a set of terminal nodes.
+
+    The interior nodes are eliminated through the Schur complement
+        L_red = L_TT - L_TI L_II^{-1} L_IT,
+    with L_II factored once by a sparse LU, so the cost is driven by the
+    fill of that factorisation and by k rather than by N³. The result is
+    again a Laplacian on the k terminals and preserves all effective
+    resistances between them.
+
+    Parameters
+    ----------
+    L : np.ndarray or scipy.sparse matrix
+        Symmetric N×N Laplacian of a connected graph.
+    nodes : sequence of int
+        The k terminal nodes, in the order of the reduced matrix.
+
+    Returns
+    -------
+    np.ndarray
+        k×k reduced Laplacian.
+    """
+    L = sp.csr_matrix(L, dtype=float)
+    nodes, interior = _split(L.shape[0], nodes)
+
+    L_TT = L[nodes][:, nodes].toarray()
+    if len(interior) == 0:
+        return L_TT
+    L_IT = L[interior][:, nodes].toarray()
+    lu = splu(L[interior][:, interior].tocsc())
+    L_red = L_TT - L_IT.T @ lu.solve(L_IT)
+    # symmetrise away round-off
+    return 0.5 * (L_red + L_red.T)
+
+
+def _grounded_pinv(M: np.ndarray) -> np.ndarray:
+    """
+    Pseudoinverse of a symmetric matrix whose null space is exactly the constants.
+
+    Uses (M + J/k)^{-1} - J/k with J the all-ones matrix, which is exact for
+    such matrices and needs no eigenvalue threshold.
+    """
+    k = M.shape[0]
+    J = np.full((k, k), 1.0 / k)
+    X = np.linalg.inv(M + J) - J
+    return 0.5 * (X + X.T)
+
+
+def kron_reduce_many(L, terminal_sets: Iterable[Sequence[int]]) -> List[np.ndarray]:
+    """
+    Kron reductions onto many terminal sets sharing one interior factorisation.
+
+    Kron reduction is transitive, so L is first reduced onto the union U of
+    all terminal sets (one sparse factorisation of the nodes outside U), and
+    the pseudoinverse X = L_U^+ is formed once. The reduced Laplacian of a
+    set T ⊆ U is then read off the matching block,
+        L_T = (P X_TT P)^+,   P = I - 11^T / k,
+    so each set costs O(k³) instead of another elimination over U.
+
+    Parameters
+    ----------
+    L : np.ndarray or scipy.sparse matrix
+        Symmetric N×N Laplacian of a connected graph.
+    terminal_sets : iterable of sequences of int
+        Terminal node sets.
+
+    Returns
+    -------
+    list of np.ndarray
+        Reduced Laplacians, one per terminal set.
+    """
+    n = L.shape[0]
+    terminal_sets = [_split(n, t)[0] for t in terminal_sets]
+    if not terminal_sets:
+        return []
+    union = np.unique(np.concatenate(terminal_sets))
+    X = _grounded_pinv(kron_reduce(L, union))
+
+    reduced = []
+    for t in terminal_sets:
+        idx = np.searchsorted(union, t)
+        X_TT = X[np.ix_(idx, idx)]
+        # centre so the constant vector is the exact null space
+        X_TT = X_TT - X_TT.mean(axis=0) - X_TT.mean(axis=1)[:, None] + X_TT.mean()
+        reduced.append(_grounded_pinv(X_TT))
+    return reduced
+
+
+def kron_resistance_matrix(L, nodes: Sequence[int]) -> np.ndarray:
+    """
+    Effective-resistance matrix between the given nodes, via Kron reduction.
+
+    Parameters
+    ----------
+    L : np.ndarray or scipy.sparse matrix
+        Symmetric N×N Laplacian of a connected graph.
+    nodes : sequence of int
+        The k nodes of interest.
+
+    Returns
+    -------
+    np.ndarray
+        k×k resistance matrix R_ij, identical to the corresponding block
+        of the full effective-resistance matrix.
+    """
+    L_red = kron_reduce(L, nodes)
+    return effective_resistance_matrix(compute_pseudoinverse(L_red, hermitian=True))
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+from typing import NamedTuple, Optional
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import eigsh
+
+
+class LowRankPseudoinverse(NamedTuple):
+    """
+    Truncated spectral factorisation L^+ ≈ U diag(s) U^T.
+
+    Attributes
+    ----------
+    U : np.ndarray
+        N×r matrix of orthonormal Laplacian eigenvectors.
+    s : np.ndarray
+        Length-r vector of reciprocal eigenvalues 1/λ_i, in decreasing order.
+    error_bound : float
+        Bound on the spectral-norm error ||L^+ - U diag(s) U^T||_2.
+    """
+
+    U: np.ndarray
+    s: np.ndarray
+    error_bound: float
+
+    @property
+    def shape(self) -> tuple:
+        n = self.U.shape[0]
+        return (n, n)
+
+    def matvec(self, x: np.ndarray) -> np.ndarray:
+        """
+        Apply the factored pseudoinverse to a vector or an N×m block.
+        """
+        coeffs = self.U.T @ x
+        if coeffs.ndim == 1:
+            return self.U @ (self.s * coeffs)
+        return self.U @ (self.s[:, None] * coeffs)
+
+    def diagonal(self) -> np.ndarray:
+        """
+        Diagonal of the factored pseudoinverse, in O(N·r).
+        """
+        return (self.U**2) @ self.s
+
+    def to_dense(self) -> np.ndarray:
+        """
+        Expand the factorisation into a dense N×N matrix.
+        """
+        return (self.U * self.s) @ self.U.T
+
+
+def _smallest_eigenpairs(L: sp.csr_matrix, k: int, sigma: float):
+    """
+    The k smallest eigenpairs of a symmetric PSD matrix, ascending.
+
+    Uses shift-invert Lanczos around ``sigma`` (< 0, so L - σI is positive
+    definite even though L is singular), or a dense solve if k is close to N.
+    """
+    n = L.shape[0]
+    if k >= n - 1:
+        w, V = np.linalg.eigh(L.toarray())
+        return w[:k], V[:, :k]
+    w, V = eigsh(L, k=k, sigma=sigma, which="LM")
+    order = np.argsort(w)
+    return w[order], V[:, order]
+
+
+def _clusters(w: np.ndarray, res: np.ndarray, scale: float) -> list:
+    """
+    Index ranges [a, b) of eigenvalues whose residual intervals overlap.
+    """
+    starts = [0] + [
+        i for i in range(1, len(w)) if w[i] - w[i - 1] > res[i] + res[i - 1] + 1e-8 * scale
+    ]
+    ends = starts[1:] + [len(w)]
+    return list(zip(starts, ends))
+
+
+def _error_bound(w: np.ndarray, R: np.ndarray, r: int, exhausted: bool, scale: float):
+    """
+    Bound on ||L^+ - V_r diag(1/w_r) V_r^T||_2 from the Ritz pairs (w, V).
+
+    ``R = L V - V diag(w)`` holds the residuals. Pairs are grouped into
+    clusters of overlapping residual intervals; for each cluster with
+    residual norm ρ and gap δ to the rest of the spectrum, the eigenvalue
+    error contributes 1/lo - 1/hi and the eigenvector (subspace) error
+    2 ρ / (lo δ) by Davis–Kahan. The discarded part contributes 1/λ of the
+    first eigenvalue past the retained clusters, plus the discarded members
+    of a cluster split by the rank. Returns None if the bound needs an
+    eigenpair that was not computed.
+    """
+    tiny = np.finfo(float).tiny
+    res = np.linalg.norm(R, axis=0)
+    groups = _clusters(w, res, scale)
+    # end of the last cluster touched by the retained pairs
+    m = next((b for a, b in groups if a < r <= b), 0)
+    if m == len(w) and not exhausted:
+        return None
+
+    bound = 0.0
+    if m < len(w):
+        bound += 1.0 / max(w[m] - res[m], tiny)
+    if r < m:
+        bound += 1.0 / max(w[r] - res[r], tiny)
+
+    for a, b in groups:
+        if a >= m:
+            break
+        rho = np.linalg.norm(R[:, a:b], ord=2)
+        lo = max(w[a] - rho, tiny)
+        hi = w[b - 1] + rho
+        lower = 0.0 if a == 0 else w[a - 1] + res[a - 1]
+        upper = w[b] - res[b] if b < len(w) else np.inf
+        gap = min(lo - lower, upper - hi)
+        if gap <= 0.0:
+            return np.inf
+        bound += (1.0 / lo - 1.0 / hi) + 2.0 * rho / (lo * gap)
+    return float(bound)
+
+
+def low_rank_pseudoinverse(
+    L,
+    rank: Optional[int] = None,
+    tol: Optional[float] = None,
+    null_tol: float = 1e-10,
+    sigma: Optional[float] = None,
+) -> LowRankPseudoinverse:
+    """
+    Truncated spectral approximation of the Laplacian pseudoinverse.
+
+    L^+ is dominated by the smallest nonzero eigenvalues of L, so it is
+    approximated by the r eigenpairs closest to the null space, computed with
+    shift-invert Lanczos on the sparse Laplacian. Exactly one of ``rank`` and
+    ``tol`` must be given.
+
+    The reported error bound is an a-posteriori bound built from the Lanczos
+    residuals ||L u - λ u||_2: the first discarded term 1/λ_{r+1}, plus the
+    eigenvalue and eigenvector (Davis–Kahan, via the spectral gaps) error of
+    every retained cluster of eigenvalues. It assumes the computed pairs are
+    the smallest ones of L, which shift-invert about a point below zero is
+    designed to deliver.
+
+    Parameters
+    ----------
+    L : np.ndarray or scipy.sparse matrix
+        Symmetric N×N Laplacian.
+    rank : int, optional
+        Number of nonzero eigenpairs to keep.
+    tol : float, optional
+        Target spectral-norm error; the smallest rank whose error bound
+        is at most ``tol`` is used.
+    null_tol : float, optional
+        Eigenvalues below ``null_tol`` times the Gershgorin bound of L are
+        treated as the null space.
+    sigma : float, optional
+        Shift for shift-invert mode. Defaults to a small negative multiple
+        of the largest diagonal entry.
+
+    Returns
+    -------
+    LowRankPseudoinverse
+        Factors (U, s) and the spectral-norm error bound.
+    """
+    if (rank is None) == (tol is None):
+        raise ValueError("Specify exactly one of rank or tol")
+    if rank is not None and rank < 1:
+        raise ValueError("rank must be >= 1")
+
+    L = sp.csr_matrix(L, dtype=float)
+    n = L.shape[0]
+    scale = 2.0 * np.abs(L.diagonal()).max()
+    if sigma is None:
+        sigma = -1e-3 * scale / 2.0
+
+    k = min(rank + 2, n) if rank is not None else min(8, n)
+    while True:
+        w, V = _smallest_eigenpairs(L, k, sigma)
+        nonzero = w > null_tol * scale
+        w, V = w[nonzero], V[:, nonzero]
+        R = L @ V - V * w
+        exhausted = k >= n
+
+        if rank is not None:
+            if rank > len(w) and exhausted:
+                raise ValueError(f"rank={rank} exceeds the number of nonzero eigenvalues ({len(w)})")
+            r = rank
+            bound = _error_bound(w, R, r, exhausted, scale) if r <= len(w) else None
+            if bound is not None:
+                break
+        else:
+            # smallest rank, starting from the terms with 1/λ > tol, whose bound meets tol
+            r0 = int(np.count_nonzero(1.0 / w > tol))
+            bound = None
+            for r in range(r0, len(w) + 1):
+                bound = _error_bound(w, R, r, exhausted, scale)
+                if bound is None or bound <= tol:
+                    break
+            if bound is not None and (bound <= tol or exhausted):
+                break
+
+        k = min(2 * k, n)
+
+    return LowRankPseudoinverse(
+        U=V[:, :r].copy(),
+        s=1.0 / w[:r],
+        error_bound=bound,
+    )
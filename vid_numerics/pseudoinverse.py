@@ -2,31 +2,163 @@ from __future__ import annotations
 
 import numpy as np
 
+# Working-set budget for one batched LAPACK call in compute_pseudoinverse.
+DEFAULT_BATCH_BYTES = 256 * 2**20
 
-def compute_pseudoinverse(L: np.ndarray, tol: float = 1e-12) -> np.ndarray:
+
+def _pinv_block(L: np.ndarray, tol: float, hermitian: bool) -> np.ndarray:
+    """
+    Pseudoinverse of a single matrix or a (B, N, N) stack in one LAPACK call.
+    """
+    if hermitian:
+        w, V = np.linalg.eigh(L)
+        keep = np.abs(w) > tol
+        w_inv = np.divide(1.0, w, out=np.zeros_like(w), where=keep)
+        return (V * w_inv[..., None, :]) @ np.swapaxes(V, -1, -2)
+
+    U, S, Vt = np.linalg.svd(L, full_matrices=False)
+    S_inv = np.divide(1.0, S, out=np.zeros_like(S), where=S > tol)
+    return (np.swapaxes(Vt, -1, -2) * S_inv[..., None, :]) @ np.swapaxes(U, -1, -2)
+
+
+def _batch_chunk_size(n: int, itemsize: int, max_bytes: int) -> int:
+    """
+    Number of n×n matrices that fit in ``max_bytes`` of decomposition workspace.
+
+    Each matrix needs roughly five n×n buffers (input copy, two factors,
+    scaled factor and result).
+    """
+    per_matrix = 5 * n * n * max(itemsize, 8)
+    return max(1, int(max_bytes // per_matrix))
+
+
+def compute_pseudoinverse(
+    L: np.ndarray,
+    tol: float = 1e-12,
+    hermitian: bool = False,
+    max_bytes: int = DEFAULT_BATCH_BYTES,
+) -> np.ndarray:
     """
     Compute the Moore–Penrose pseudoinverse of a matrix using SVD.
 
+    A (B, N, N) stack is processed with batched decompositions, split into
+    chunks so that each call stays within ``max_bytes`` of workspace.
+
     Parameters
     ----------
     L : np.ndarray
-        Input matrix (e.g., Laplacian).
+        Input matrix (e.g., Laplacian) of shape (N, N), or a stack of
+        matrices of shape (B, N, N).
     tol : float, optional
         Singular values below this threshold are treated as zero.
+    hermitian : bool, optional
+        If True, L is assumed symmetric and ``eigh`` is used instead of SVD;
+        eigenvalues with magnitude below ``tol`` are treated as zero.
+    max_bytes : int, optional
+        Approximate memory budget per batched call for stacked input.
 
     Returns
     -------
     np.ndarray
-        Pseudoinverse of L.
+        Pseudoinverse of L, with the same shape as L.
     """
-    U, S, Vt = np.linalg.svd(L, full_matrices=False)
+    L = np.asarray(L)
+    if L.ndim == 2:
+        return _pinv_block(L, tol, hermitian)
+    if L.ndim != 3 or L.shape[-1] != L.shape[-2]:
+        raise ValueError(f"Expected an (N, N) matrix or (B, N, N) stack, got shape {L.shape}")
+
+    B, n, _ = L.shape
+    out = np.empty(L.shape, dtype=np.result_type(L.dtype, float))
+    chunk = _batch_chunk_size(n, L.dtype.itemsize, max_bytes)
+    for start in range(0, B, chunk):
+        stop = min(start + chunk, B)
+        out[start:stop] = _pinv_block(L[start:stop], tol, hermitian)
+    return out
+
+
+def verify_pseudoinverse(
+    L,
+    L_pinv: np.ndarray,
+    trials: int = 8,
+    rtol: float = 1e-8,
+    check_null: bool = True,
+    seed=None,
+) -> dict:
+    """
+    Randomized check of the Moore–Penrose conditions for a candidate L^+.
+
+    Each identity A = B is tested Freivalds-style on a block of ``trials``
+    random sign vectors Z, comparing A Z with B Z using matrix–vector
+    products only, so the cost is O(trials·N²) for dense L (O(trials·nnz)
+    for the products with a sparse L) instead of the O(N³) of forming
+    L L^+ L explicitly. For ±1 probes E||M z||² = ||M||_F², so each residual
+    is a randomized estimate (numerator and normalisation alike) of the
+    relative Frobenius-norm error, compared against ``rtol``.
+
+    ``failure_probability`` = 2^-trials is the Freivalds bound on a nonzero
+    defect M giving M Z = 0 exactly. It is not a bound on a defect above
+    ``rtol`` being estimated below it: that depends on how the defect is
+    spread over its singular values, and only the estimate's relative spread
+    shrinks with ``trials`` (roughly like 1/sqrt(trials)).
+
+    Conditions checked (X = L^+):
+        penrose1 : L X L = L
+        penrose2 : X L X = X
+        penrose3 : (L X)^T = L X
+        penrose4 : (X L)^T = X L
+        null     : X 1 = 0  (connected-graph Laplacian)
+
+    Parameters
+    ----------
+    L : np.ndarray or scipy.sparse matrix
+        N×N matrix (e.g., Laplacian).
+    L_pinv : np.ndarray
+        Candidate pseudoinverse of L.
+    trials : int, optional
+        Number of random probe vectors.
+    rtol : float, optional
+        Relative residual below which a condition is considered satisfied.
+    check_null : bool, optional
+        If True, also check that the constant vector is annihilated.
+    seed : int or np.random.Generator, optional
+        Seed for the probe vectors.
+
+    Returns
+    -------
+    dict
+        Relative residual estimate per condition, ``"passed"`` (all
+        residuals below ``rtol``) and ``"failure_probability"`` (the
+        probability that a nonzero defect is estimated as exactly zero).
+    """
+    rng = np.random.default_rng(seed)
+    n = L_pinv.shape[0]
+    Z = rng.choice([-1.0, 1.0], size=(n, trials))
+
+    def rel(diff, ref):
+        return float(np.linalg.norm(diff) / max(np.linalg.norm(ref), np.finfo(float).tiny))
+
+    X = L_pinv
+    LZ = L @ Z
+    XLZ = X @ LZ
+    XZ = X @ Z
+    LXZ = L @ XZ
 
-    S_inv = np.zeros_like(S)
-    for i, s in enumerate(S):
-        if s > tol:
-            S_inv[i] = 1.0 / s
-        else:
-            S_inv[i] = 0.0
+    residuals = {
+        "penrose1": rel(L @ XLZ - LZ, LZ),
+        "penrose2": rel(X @ (L @ XZ) - XZ, XZ),
+        "penrose3": rel(X.T @ (L.T @ Z) - LXZ, LXZ),
+        "penrose4": rel(L.T @ (X.T @ Z) - XLZ, XLZ),
+    }
+    if check_null:
+        ones = np.ones(n)
+        # scale by ||X||_F estimate times ||1|| so the residual is relative
+        residuals["null"] = float(
+            np.linalg.norm(X @ ones)
+            / max(np.linalg.norm(XZ) / np.sqrt(trials) * np.sqrt(n), np.finfo(float).tiny)
+        )
 
-    L_pinv = (Vt.T * S_inv) @ U.T
-    return L_pinv
+    result = dict(residuals)
+    result["passed"] = all(r <= rtol for r in residuals.values())
+    result["failure_probability"] = 2.0 ** (-trials)
+    return result
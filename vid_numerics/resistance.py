@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from typing import Union
+
+import numpy as np
+
+from .lowrank import LowRankPseudoinverse
+
+PseudoinverseLike = Union[np.ndarray, LowRankPseudoinverse]
+
+
+def effective_resistance_matrix(L_pinv: PseudoinverseLike) -> np.ndarray:
+    """
+    Compute the effective-resistance matrix R from the Laplacian pseudoinverse L^+.
+
+    For an undirected connected graph,
+        R_ij = L^+_{ii} + L^+_{jj} - 2 L^+_{ij}.
+
+    Parameters
+    ----------
+    L_pinv : np.ndarray or LowRankPseudoinverse
+        Moore–Penrose pseudoinverse of the graph Laplacian, shape (N, N),
+        a stack of pseudoinverses of shape (B, N, N), or a factored
+        low-rank approximation.
+
+    Returns
+    -------
+    np.ndarray
+        Effective-resistance matrix R of the same shape as L_pinv.
+    """
+    if isinstance(L_pinv, LowRankPseudoinverse):
+        diag = L_pinv.diagonal()
+        return diag[:, None] + diag[None, :] - 2.0 * L_pinv.to_dense()
+
+    L_pinv = np.asarray(L_pinv)
+    diag = np.diagonal(L_pinv, axis1=-2, axis2=-1)
+    R = diag[..., :, None] + diag[..., None, :] - 2.0 * L_pinv
+    return R
+
+
+def effective_resistance(L_pinv: PseudoinverseLike, i, j) -> np.ndarray:
+    """
+    Effective resistance between node pairs (i, j) without forming R.
+
+    With a factored L^+ ≈ U diag(s) U^T each query costs O(r):
+        R_ij = sum_k s_k (U_ik - U_jk)^2.
+
+    Parameters
+    ----------
+    L_pinv : np.ndarray or LowRankPseudoinverse
+        Dense N×N pseudoinverse or a factored low-rank approximation.
+    i, j : int or array_like of int
+        Node indices; arrays are broadcast against each other.
+
+    Returns
+    -------
+    np.ndarray
+        Effective resistances R_ij with the broadcast shape of i and j.
+    """
+    i = np.asarray(i)
+    j = np.asarray(j)
+    if isinstance(L_pinv, LowRankPseudoinverse):
+        diff = L_pinv.U[i] - L_pinv.U[j]
+        return (diff**2) @ L_pinv.s
+
+    L_pinv = np.asarray(L_pinv)
+    return L_pinv[i, i] + L_pinv[j, j] - 2.0 * L_pinv[i, j]
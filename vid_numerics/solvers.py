@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import warnings
+from collections import OrderedDict, deque
+from typing import Callable, Hashable, Optional, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import splu
+
+
+def _project_mean(x: np.ndarray) -> np.ndarray:
+    """
+    Remove the component along the constant vector (the Laplacian null space).
+    """
+    return x - x.mean(axis=0)
+
+
+def grounded_solver(L, ground: Optional[int] = None) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Factor a connected Laplacian once and return x ↦ L^+ x.
+
+    The row and column of one ``ground`` node are removed, the remaining
+    (positive definite) block is LU-factored, and solutions are projected
+    onto the complement of the constant vector, which yields exactly L^+ x
+    for right-hand sides of any mean.
+
+    Parameters
+    ----------
+    L : np.ndarray or scipy.sparse matrix
+        Symmetric N×N Laplacian of a connected graph.
+    ground : int, optional
+        Node to ground; defaults to the node of largest degree.
+
+    Returns
+    -------
+    callable
+        Function applying L^+ to a vector or an N×m block.
+    """
+    L = sp.csc_matrix(L, dtype=float)
+    n = L.shape[0]
+    if ground is None:
+        ground = int(np.argmax(L.diagonal()))
+    keep = np.delete(np.arange(n), ground)
+    lu = splu(L[keep][:, keep].tocsc())
+
+    def apply(b: np.ndarray) -> np.ndarray:
+        b = _project_mean(np.asarray(b, dtype=float))
+        x = np.zeros_like(b)
+        x[keep] = lu.solve(np.ascontiguousarray(b[keep]))
+        return _project_mean(x)
+
+    return apply
+
+
+def pcg(
+    A: Callable[[np.ndarray], np.ndarray],
+    b: np.ndarray,
+    x0: Optional[np.ndarray] = None,
+    M: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+    rtol: float = 1e-10,
+    max_iter: int = 1000,
+) -> Tuple[np.ndarray, int, bool]:
+    """
+    Preconditioned conjugate gradients for a consistent singular Laplacian system.
+
+    Parameters
+    ----------
+    A : callable
+        Matrix–vector product with the (PSD) system matrix.
+    b : np.ndarray
+        Right-hand side, assumed orthogonal to the null space of A.
+    x0 : np.ndarray, optional
+        Initial guess.
+    M : callable, optional
+        Preconditioner application z = M r.
+    rtol : float, optional
+        Stop when ||b - A x|| <= rtol ||b||.
+    max_iter : int, optional
+        Iteration cap.
+
+    Returns
+    -------
+    (np.ndarray, int, bool)
+        (solution, iterations, converged)
+    """
+    x = np.zeros_like(b) if x0 is None else x0.copy()
+    r = b - A(x)
+    target = rtol * np.linalg.norm(b)
+    if np.linalg.norm(r) <= target:
+        return x, 0, True
+
+    z = M(r) if M is not None else r
+    p = z.copy()
+    rz = r @ z
+    for it in range(1, max_iter + 1):
+        Ap = A(p)
+        alpha = rz / (p @ Ap)
+        x += alpha * p
+        r -= alpha * Ap
+        if np.linalg.norm(r) <= target:
+            return x, it, True
+        z = M(r) if M is not None else r
+        rz_new = r @ z
+        p = z + (rz_new / rz) * p
+        rz = rz_new
+    return x, max_iter, False
+
+
+class LaplacianSequenceSolver:
+    """
+    Warm-started solves across a sequence of slowly reweighted Laplacians.
+
+    For each new Laplacian in the sequence (``update``), systems L x = b are
+    solved with preconditioned CG where
+
+    - the preconditioner is an exact grounded factorisation of an earlier
+      Laplacian in the sequence, reused until it stops paying off;
+    - the initial guess is the Galerkin solution over a recycled subspace
+      spanned by the most recent solutions (which contains the previous
+      step's solution for the same right-hand side), so smooth weight
+      changes need only a few iterations.
+
+    When an iteration count exceeds ``refactor_ratio`` times the baseline
+    count (the first solve after the last factorisation, or the cold re-solve
+    that follows a refactorisation), the current Laplacian is refactored and
+    the solve repeated from scratch. A RuntimeWarning is issued if even that
+    solve does not converge.
+
+    Parameters
+    ----------
+    rtol : float, optional
+        Relative residual tolerance for CG.
+    max_iter : int, optional
+        CG iteration cap per solve.
+    refactor_ratio : float, optional
+        Degradation factor that triggers refactorisation.
+    min_iter : int, optional
+        Iteration counts at or below this never trigger refactorisation.
+    recycle : int, optional
+        Number of recent solutions kept in the recycled subspace.
+    cache_size : int, optional
+        Number of keyed solutions kept for warm starts (least recently used
+        are evicted); defaults to ``recycle``.
+    """
+
+    def __init__(
+        self,
+        rtol: float = 1e-10,
+        max_iter: int = 500,
+        refactor_ratio: float = 3.0,
+        min_iter: int = 5,
+        recycle: int = 8,
+        cache_size: Optional[int] = None,
+    ):
+        self.rtol = rtol
+        self.max_iter = max_iter
+        self.refactor_ratio = refactor_ratio
+        self.min_iter = min_iter
+        self.L = None
+        self.n_factorizations = 0
+        self.last_iterations = 0
+        self._precond = None
+        self._baseline_iter = None
+        self.cache_size = recycle if cache_size is None else cache_size
+        self._solutions: "OrderedDict[Hashable, np.ndarray]" = OrderedDict()
+        self._basis = deque(maxlen=recycle)
+
+    def update(self, L) -> None:
+        """
+        Advance the sequence to a new Laplacian of the same size.
+        """
+        L = sp.csr_matrix(L, dtype=float)
+        if self.L is not None and L.shape != self.L.shape:
+            raise ValueError(f"Laplacian shape changed from {self.L.shape} to {L.shape}")
+        self.L = L
+        if self._precond is None:
+            self.refactor()
+
+    def refactor(self) -> None:
+        """
+        Rebuild the preconditioner from the current Laplacian.
+        """
+        if self.L is None:
+            raise ValueError("No Laplacian set; call update() first")
+        self._precond = grounded_solver(self.L)
+        self._baseline_iter = None
+        self.n_factorizations += 1
+
+    def forget(self, key: Optional[Hashable] = None) -> None:
+        """
+        Drop the cached solution for ``key``, or all cached solutions if None.
+        """
+        if key is None:
+            self._solutions.clear()
+        else:
+            self._solutions.pop(key, None)
+
+    def _remember(self, key: Hashable, x: np.ndarray) -> None:
+        self._solutions[key] = x
+        self._solutions.move_to_end(key)
+        while len(self._solutions) > self.cache_size:
+            self._solutions.popitem(last=False)
+
+    def _initial_guess(self, b: np.ndarray, key: Hashable) -> Optional[np.ndarray]:
+        vecs = list(self._basis)
+        if key in self._solutions:
+            vecs.append(self._solutions[key])
+        if not vecs:
+            return None
+        W, _ = np.linalg.qr(np.column_stack(vecs))
+        LW = self.L @ W
+        # Galerkin projection onto span(W); lstsq tolerates a rank-deficient basis
+        y = np.linalg.lstsq(W.T @ LW, W.T @ b, rcond=None)[0]
+        return W @ y
+
+    def solve(self, b: np.ndarray, key: Optional[Hashable] = None) -> np.ndarray:
+        """
+        Solve L x = b (x ⟂ 1) for the current Laplacian.
+
+        Parameters
+        ----------
+        b : np.ndarray
+            Right-hand side; its mean is removed.
+        key : hashable, optional
+            Identifies the right-hand side across steps, so the previous
+            step's solution for the same key seeds the initial guess.
+
+        Returns
+        -------
+        np.ndarray
+            Minimum-norm solution L^+ b.
+        """
+        if self.L is None:
+            raise ValueError("No Laplacian set; call update() first")
+        b = _project_mean(np.asarray(b, dtype=float))
+        A = self.L.__matmul__
+
+        x0 = self._initial_guess(b, key)
+        x, iters, converged = pcg(A, b, x0, self._precond, self.rtol, self.max_iter)
+
+        degraded = self._baseline_iter is not None and iters > self.refactor_ratio * max(
+            self._baseline_iter, self.min_iter
+        )
+        if not converged or degraded:
+            self.refactor()
+            # cold start, so the new baseline is not flattered by the failed iterate
+            x, iters, converged = pcg(A, b, None, self._precond, self.rtol, self.max_iter)
+            if not converged:
+                warnings.warn(
+                    f"CG did not converge to rtol={self.rtol:g} in {self.max_iter} iterations "
+                    "even after refactorisation",
+                    RuntimeWarning,
+                    stacklevel=2,
+                )
+        if self._baseline_iter is None:
+            self._baseline_iter = iters
+
+        x = _project_mean(x)
+        self.last_iterations = iters
+        if key is not None:
+            self._remember(key, x)
+        self._basis.append(x)
+        return x
+
+    def effective_resistance(self, i: int, j: int) -> float:
+        """
+        Effective resistance R_ij of the current Laplacian, warm-started per pair.
+        """
+        b = np.zeros(self.L.shape[0])
+        b[i] += 1.0
+        b[j] -= 1.0
+        x = self.solve(b, key=("resistance", i, j))
+        return float(x[i] - x[j])
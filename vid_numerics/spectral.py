@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import warnings
+from typing import Optional
+
+import numpy as np
+import scipy.sparse as sp
+
+
+def _as_columns(vectors: np.ndarray):
+    """
+    View a vector or N×m block as N×m, remembering whether to squeeze.
+    """
+    b = np.asarray(vectors, dtype=float)
+    return (b[:, None], True) if b.ndim == 1 else (b, False)
+
+
+def _eigh_dense(L):
+    L = L.toarray() if sp.issparse(L) else np.asarray(L, dtype=float)
+    return np.linalg.eigh(L)
+
+
+def _spectral_apply(V: np.ndarray, filters: np.ndarray, vectors: Optional[np.ndarray]) -> np.ndarray:
+    """
+    Evaluate V diag(f_k) V^T (or its action on vectors) for each row f_k of ``filters``.
+    """
+    if vectors is None:
+        return np.stack([(V * f) @ V.T for f in filters])
+    b, squeeze = _as_columns(vectors)
+    coeffs = V.T @ b
+    out = np.stack([V @ (f[:, None] * coeffs) for f in filters])
+    return out[..., 0] if squeeze else out
+
+
+def multishift_cg(
+    L,
+    b: np.ndarray,
+    shifts: np.ndarray,
+    rtol: float = 1e-10,
+    max_iter: int = 1000,
+) -> np.ndarray:
+    """
+    Solve (L + μ I) x = b for every shift μ >= 0 from a single Krylov run.
+
+    All shifted systems share the Krylov space of the seed system (the
+    smallest shift), so one sequence of matrix–vector products serves every
+    shift (multi-shift CG). L must be a Laplacian (L 1 = 0): the component
+    of b along the constant vector is handled analytically, and a zero
+    shift returns the minimum-norm solution L^+ b. A RuntimeWarning is issued
+    if any shift has not converged after ``max_iter`` iterations.
+
+    Parameters
+    ----------
+    L : np.ndarray or scipy.sparse matrix
+        Symmetric positive semidefinite N×N Laplacian.
+    b : np.ndarray
+        Right-hand side of length N.
+    shifts : array_like
+        Nonnegative shifts μ.
+    rtol : float, optional
+        Relative residual tolerance, enforced for every shift.
+    max_iter : int, optional
+        Iteration cap.
+
+    Returns
+    -------
+    np.ndarray
+        Solutions of shape (len(shifts), N).
+    """
+    shifts = np.atleast_1d(np.asarray(shifts, dtype=float))
+    if shifts.size == 0:
+        raise ValueError("At least one shift is required")
+    if np.any(shifts < 0):
+        raise ValueError("Shifts must be nonnegative")
+    b = np.asarray(b, dtype=float)
+    mean = b.mean()
+    r = b - mean
+
+    i_seed = int(np.argmin(shifts))
+    seed = shifts[i_seed]
+    sigma = shifts - seed
+    n_shift = len(shifts)
+
+    x = np.zeros((n_shift, b.size))
+    p = np.tile(r, (n_shift, 1))
+    zeta = np.ones(n_shift)
+    zeta_prev = np.ones(n_shift)
+    alpha_prev, beta_prev = 1.0, 0.0
+    rr = r @ r
+    target = rtol * np.linalg.norm(b)
+
+    active = np.ones(n_shift, dtype=bool)
+    for _ in range(max_iter):
+        # shifted residuals are zeta * r; retire systems as they converge
+        active &= np.sqrt(rr) * np.abs(zeta) > target
+        if not active.any():
+            break
+        a = np.flatnonzero(active)
+
+        # the seed system has zeta == 1, so its direction is the CG direction
+        p_seed = p[i_seed]
+        Ap = L @ p_seed + seed * p_seed
+        alpha = rr / (p_seed @ Ap)
+
+        z, z_prev = zeta[a], zeta_prev[a]
+        denom = alpha * beta_prev * (z_prev - z) + z_prev * alpha_prev * (1.0 + sigma[a] * alpha)
+        z_next = z * z_prev * alpha_prev / denom
+        x[a] += (alpha * z_next / z)[:, None] * p[a]
+
+        r = r - alpha * Ap
+        rr_new = r @ r
+        beta = rr_new / rr
+        p[a] = z_next[:, None] * r + (beta * (z_next / z) ** 2)[:, None] * p[a]
+        if i_seed not in a:
+            # the seed direction still drives the remaining shifts
+            p[i_seed] = r + beta * p_seed
+
+        zeta_prev[a], zeta[a] = z, z_next
+        alpha_prev, beta_prev, rr = alpha, beta, rr_new
+
+    active &= np.sqrt(rr) * np.abs(zeta) > target
+    if active.any():
+        warnings.warn(
+            f"multi-shift CG did not converge to rtol={rtol:g} in {max_iter} iterations "
+            f"for shifts {shifts[active].tolist()}",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+
+    # constant component: (L + μ I)^{-1} 1 = 1/μ, and L^+ 1 = 0
+    const = np.divide(mean, shifts, out=np.zeros_like(shifts), where=shifts > 0)
+    return x + const[:, None]
+
+
+def regularized_propagators(
+    L,
+    mus,
+    vectors: Optional[np.ndarray] = None,
+    rtol: float = 1e-10,
+    max_iter: int = 1000,
+) -> np.ndarray:
+    """
+    Regularised propagators (L + μ I)^{-1} for a whole array of μ.
+
+    Dense input (or no ``vectors``) uses a single eigendecomposition of L;
+    sparse input with ``vectors`` uses one multi-shift CG run per vector.
+    μ = 0 yields the pseudoinverse L^+ (zero modes are dropped).
+
+    Parameters
+    ----------
+    L : np.ndarray or scipy.sparse matrix
+        Symmetric positive semidefinite N×N Laplacian.
+    mus : array_like
+        Nonnegative regularisation parameters, length M.
+    vectors : np.ndarray, optional
+        Vector of length N or N×m block to apply the propagators to.
+        If omitted, dense propagators are returned.
+    rtol, max_iter : optional
+        Multi-shift CG controls (sparse path only).
+
+    Returns
+    -------
+    np.ndarray
+        (M, N, N) stack of propagators, or their action on ``vectors`` with
+        shape (M, N) or (M, N, m).
+    """
+    mus = np.atleast_1d(np.asarray(mus, dtype=float))
+    if mus.size == 0:
+        raise ValueError("At least one regularisation parameter is required")
+    if np.any(mus < 0):
+        raise ValueError("Regularisation parameters must be nonnegative")
+
+    if sp.issparse(L) and vectors is not None:
+        b, squeeze = _as_columns(vectors)
+        out = np.stack(
+            [multishift_cg(L, b[:, k], mus, rtol=rtol, max_iter=max_iter) for k in range(b.shape[1])],
+            axis=-1,
+        )
+        return out[..., 0] if squeeze else out
+
+    w, V = _eigh_dense(L)
+    shifted = w[None, :] + mus[:, None]
+    scale = 1e-12 * max(np.abs(w).max(), 1.0)
+    filters = np.divide(1.0, shifted, out=np.zeros_like(shifted), where=np.abs(shifted) > scale)
+    return _spectral_apply(V, filters, vectors)
+
+
+def filtered_pseudoinverses(L, cutoffs, vectors: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Spectrally truncated pseudoinverses for a whole array of cutoffs.
+
+    For each cutoff c, eigenvalues with |λ| <= c are discarded:
+        L^+_c = sum_{|λ_i| > c} λ_i^{-1} v_i v_i^T,
+    which matches ``compute_pseudoinverse(L, tol=c)`` for a symmetric L.
+    All cutoffs share one eigendecomposition. Dense stacks are built by
+    adding rank-one terms as the cutoff decreases, so a scan over M cutoffs
+    costs O(N³ + M·N²) rather than M separate decompositions.
+
+    Parameters
+    ----------
+    L : np.ndarray or scipy.sparse matrix
+        Symmetric N×N matrix.
+    cutoffs : array_like
+        Spectral cutoffs, length M.
+    vectors : np.ndarray, optional
+        Vector of length N or N×m block to apply the filtered
+        pseudoinverses to. If omitted, dense matrices are returned.
+
+    Returns
+    -------
+    np.ndarray
+        (M, N, N) stack in the order of ``cutoffs``, or its action on
+        ``vectors`` with shape (M, N) or (M, N, m).
+    """
+    cutoffs = np.atleast_1d(np.asarray(cutoffs, dtype=float))
+    if cutoffs.size == 0:
+        raise ValueError("At least one cutoff is required")
+    w, V = _eigh_dense(L)
+    inv = np.divide(1.0, w, out=np.zeros_like(w), where=w != 0)
+
+    if vectors is not None:
+        filters = np.where(np.abs(w)[None, :] > cutoffs[:, None], inv[None, :], 0.0)
+        return _spectral_apply(V, filters, vectors)
+
+    # add eigen-terms in order of decreasing |λ| as the cutoff decreases
+    order = np.argsort(-np.abs(w))
+    absw = np.abs(w)[order]
+    n = len(w)
+    out = np.empty((len(cutoffs), n, n))
+    acc = np.zeros((n, n))
+    added = 0
+    for k in np.argsort(-cutoffs):
+        stop = int(np.searchsorted(-absw, -cutoffs[k], side="left"))
+        if stop > added:
+            idx = order[added:stop]
+            acc += (V[:, idx] * inv[idx]) @ V[:, idx].T
+            added = stop
+        out[k] = acc
+    return out